@@ -1,38 +1,111 @@
 import streamlit as st
 import numpy as np
-import pandas as pd
-import joblib
 import os
+import importlib.util
+import math
+import base64
+from pathlib import Path
+from collections import deque
+from itertools import islice
 from datetime import datetime
 
 # Optional imports - install if needed: pip install plotly
-try:
-    import plotly.graph_objects as go
-    import plotly.express as px
-    PLOTLY_AVAILABLE = True
-except ImportError:
-    PLOTLY_AVAILABLE = False
+# Plotly is only imported when a gauge is actually drawn
+PLOTLY_AVAILABLE = importlib.util.find_spec("plotly") is not None
 
 # Configuration
-MODEL_PATH = os.path.join("model", "logistic_model.pkl")
-SCALER_PATH = os.path.join("model", "scaler.pkl")
+MODEL_PATH = os.path.join("model", "weights.npz")
+STYLES_PATH = os.path.join("assets", "styles.css")
+MOTIVATION_PATH = os.path.join("assets", "motivation.html")
 
-# Function to encode image for display
-def get_base64_image(image_path):
+# Risk thresholds: overall risk is binned on the predicted percentage,
+# np.searchsorted(_BINS, prob, side='right') -> 0 (<20), 1 (<50), 2 (>=50)
+_BINS = np.array([20, 50])
+_RISKS = [
+    ("Low Risk", "#96ceb4", "✅", [
+        "Continue maintaining healthy lifestyle habits",
+        "Regular exercise and balanced diet",
+        "Annual health check-ups"
+    ]),
+    ("Moderate Risk", "#ffeaa7", "⚠️", [
+        "Consider lifestyle modifications",
+        "Monitor blood pressure and cholesterol regularly",
+        "Discuss prevention strategies with your doctor"
+    ]),
+    ("High Risk", "#fab1a0", "🚨", [
+        "Immediate medical consultation recommended",
+        "Consider medication if advised by physician",
+        "Urgent lifestyle changes needed"
+    ]),
+]
+# Fallback progress-bar colours, indexed like _RISKS
+_RISK_GRADIENTS = (
+    "linear-gradient(to right, #00b894, #55a3ff)",
+    "linear-gradient(to right, #ffeaa7, #fdcb6e)",
+    "linear-gradient(to right, #ff6b6b, #fab1a0)",
+)
+_RELATIVE_RISK_CUTOFF = float(_BINS.mean())
+
+# Per-factor bin edges; a value strictly above an edge moves up one level
+_FACTOR_LEVELS = ("Low", "Moderate", "High")
+_AGE_BINS = np.array([45, 65])
+_CHOL_BINS = np.array([200, 240])
+_SYS_BP_BINS = np.array([120, 140])
+_DIA_BP_BINS = np.array([90, 90])  # diastolic > 90 alone means High
+_BMI_BINS = np.array([25, 30])
+
+def _factor_level(bins, value):
+    return _FACTOR_LEVELS[int(np.searchsorted(bins, value))]
+
+_RISK_COLUMNS = ('Factor', 'Your Value', 'Risk Level')
+
+def _risk_row(age, male, smoker, chol, sys_bp, dia_bp, bmi, diabetes):
+    """Risk-factor table rows as (factor, value, level) tuples."""
+    bp_level = max(np.searchsorted(_SYS_BP_BINS, sys_bp), np.searchsorted(_DIA_BP_BINS, dia_bp))
+    return (
+        ('Age', str(age), _factor_level(_AGE_BINS, age)),
+        ('Gender', male, 'Higher' if male == 'Male' else 'Lower'),
+        ('Smoking', smoker, 'High' if smoker == 'Yes' else 'Low'),
+        ('Cholesterol', str(chol), _factor_level(_CHOL_BINS, chol)),
+        ('Blood Pressure', f"{sys_bp}/{dia_bp}", _FACTOR_LEVELS[bp_level]),
+        ('BMI', f"{bmi:.1f}", _factor_level(_BMI_BINS, bmi)),
+        ('Diabetes', diabetes, 'High' if diabetes == 'Yes' else 'Low'),
+    )
+
+# Static CSS/HTML is read from disk once and the same string object is
+# reused across reruns (cache_resource skips cache_data's per-call copy)
+@st.cache_resource
+def read_asset(path):
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+# Encode the header icon as an inline <img> tag (cached per path)
+@st.cache_data
+def _icon_img_tag(image_path):
+    encoded = base64.b64encode(Path(image_path).read_bytes()).decode('ascii')
+    return (f'<img src="data:image/png;base64,{encoded}" width="60" '
+            f'style="vertical-align:middle; margin-right: 15px;">')
+
+# A missing icon raises inside the cached function, so the failure is not
+# cached and the icon is picked up once it appears on disk
+def header_icon_html(image_path):
     try:
-        import base64
-        with open(image_path, "rb") as img_file:
-            return base64.b64encode(img_file.read()).decode()
-    except:
+        return _icon_img_tag(image_path)
+    except OSError:
         return None
 
 # Load model and scaler with error handling
+# The scaler is folded into the logistic weights once here, so a prediction
+# is a single dot product: z = W . x + B  with  W = coef / scale,
+# B = intercept - coef . (mean / scale)
 @st.cache_resource
 def load_models():
     try:
-        model = joblib.load(MODEL_PATH)
-        scaler = joblib.load(SCALER_PATH)
-        return model, scaler
+        with np.load(MODEL_PATH) as w:
+            coef, intercept, mean, scale = w['coef'], w['intercept'], w['mean'], w['scale']
+        W = (coef / scale).astype(np.float32)
+        B = float(intercept[0] - np.dot(coef, mean / scale))
+        return W, B
     except FileNotFoundError:
         st.error("Model files not found. Please ensure the model is properly trained and saved.")
         st.stop()
@@ -40,7 +113,7 @@ def load_models():
         st.error(f"Error loading models: {str(e)}")
         st.stop()
 
-model, scaler = load_models()
+W, B = load_models()
 
 # Page configuration
 st.set_page_config(
@@ -51,158 +124,10 @@ st.set_page_config(
 )
 
 # Enhanced CSS with dark mode support and animations
-st.markdown("""
-<style>
-@import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
-
-:root {
-    --primary-color: #ff6b6b;
-    --secondary-color: #4ecdc4;
-    --accent-color: #45b7d1;
-    --success-color: #96ceb4;
-    --warning-color: #ffeaa7;
-    --danger-color: #fab1a0;
-    --bg-gradient: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-    --glass-bg: rgba(255, 255, 255, 0.1);
-    --glass-border: rgba(255, 255, 255, 0.2);
-    --text-color: #2d3436;
-    --shadow: 0 8px 32px 0 rgba(31, 38, 135, 0.37);
-}
-
-[data-theme="dark"] {
-    --bg-gradient: linear-gradient(135deg, #232526 0%, #414345 100%);
-    --glass-bg: rgba(0, 0, 0, 0.2);
-    --glass-border: rgba(255, 255, 255, 0.1);
-    --text-color: #ddd;
-}
-
-body {
-    background: var(--bg-gradient);
-    font-family: 'Inter', sans-serif;
-    color: var(--text-color);
-}
-
-.main-container {
-    background: var(--glass-bg);
-    backdrop-filter: blur(15px);
-    border: 1px solid var(--glass-border);
-    border-radius: 20px;
-    padding: 2rem;
-    margin: 1rem;
-    box-shadow: var(--shadow);
-    animation: slideIn 0.6s ease-out;
-}
-
-@keyframes slideIn {
-    from { opacity: 0; transform: translateY(30px); }
-    to { opacity: 1; transform: translateY(0); }
-}
-
-.header-container {
-    text-align: center;
-    padding: 2rem 0;
-    background: var(--glass-bg);
-    border-radius: 15px;
-    margin-bottom: 2rem;
-    backdrop-filter: blur(10px);
-}
-
-.title {
-    font-size: 3rem;
-    font-weight: 700;
-    background: linear-gradient(45deg, var(--primary-color), var(--accent-color));
-    -webkit-background-clip: text;
-    -webkit-text-fill-color: transparent;
-    margin: 0;
-}
-
-.subtitle {
-    font-size: 1.2rem;
-    color: var(--text-color);
-    opacity: 0.8;
-    margin-top: 0.5rem;
-}
-
-.input-section {
-    background: var(--glass-bg);
-    border-radius: 15px;
-    padding: 1.5rem;
-    margin: 1rem 0;
-    backdrop-filter: blur(10px);
-    border: 1px solid var(--glass-border);
-    transition: all 0.3s ease;
-}
-
-.input-section:hover {
-    transform: translateY(-2px);
-    box-shadow: 0 12px 40px rgba(0,0,0,0.15);
-}
-
-.risk-gauge {
-    background: var(--glass-bg);
-    border-radius: 15px;
-    padding: 2rem;
-    text-align: center;
-    backdrop-filter: blur(15px);
-    border: 1px solid var(--glass-border);
-    margin: 2rem 0;
-}
-
-.metric-card {
-    background: var(--glass-bg);
-    border-radius: 12px;
-    padding: 1rem;
-    margin: 0.5rem;
-    backdrop-filter: blur(10px);
-    border: 1px solid var(--glass-border);
-    text-align: center;
-    transition: transform 0.3s ease;
-}
-
-.metric-card:hover {
-    transform: scale(1.05);
-}
-
-.stButton > button {
-    background: linear-gradient(45deg, var(--primary-color), var(--accent-color));
-    border: none;
-    border-radius: 10px;
-    color: white;
-    font-weight: 600;
-    padding: 0.75rem 2rem;
-    font-size: 1.1rem;
-    transition: all 0.3s ease;
-    box-shadow: 0 4px 15px rgba(0,0,0,0.2);
-}
-
-.stButton > button:hover {
-    transform: translateY(-2px);
-    box-shadow: 0 8px 25px rgba(0,0,0,0.3);
-}
-
-.info-card {
-    background: var(--glass-bg);
-    border-left: 4px solid var(--accent-color);
-    border-radius: 8px;
-    padding: 1rem;
-    margin: 1rem 0;
-    backdrop-filter: blur(10px);
-}
+st.markdown(f"<style>{read_asset(STYLES_PATH)}</style>", unsafe_allow_html=True)
 
-.disclaimer {
-    background: var(--glass-bg);
-    border-radius: 10px;
-    padding: 1rem;
-    margin-top: 2rem;
-    backdrop-filter: blur(10px);
-    border: 1px solid var(--warning-color);
-    color: #856404;
-}
-</style>
-""", unsafe_allow_html=True)
-
-# Sidebar for additional information
-with st.sidebar:
+# Static page sections
+def render_risk_factor_info():
     st.markdown("### 🔍 Risk Factor Information")
     
     risk_factors = {
@@ -217,118 +142,52 @@ with st.sidebar:
     for factor, description in risk_factors.items():
         with st.expander(f"📊 {factor}"):
             st.write(description)
+
+def render_header(icon_path):
+    heart_icon_img = header_icon_html(icon_path)
+    
+    if heart_icon_img:
+        st.markdown(f"""
+        <div class="header-container">
+            {heart_icon_img}
+            <h1 class="title" style="display: inline;">Heart Disease Risk Assessment</h1>
+            <p class="subtitle">AI-Powered 10-Year Cardiovascular Risk Prediction</p>
+        </div>
+        """, unsafe_allow_html=True)
+    else:
+        st.markdown("""
+        <div class="header-container">
+            <h1 class="title">❤️ Heart Disease Risk Assessment</h1>
+            <p class="subtitle">AI-Powered 10-Year Cardiovascular Risk Prediction</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+def render_motivation():
+    st.markdown(read_asset(MOTIVATION_PATH), unsafe_allow_html=True)
+
+# Sidebar for additional information
+with st.sidebar:
+    render_risk_factor_info()
     
     st.markdown("---")
     st.markdown("### 📈 Prediction History")
     if 'prediction_history' not in st.session_state:
-        st.session_state.prediction_history = []
+        st.session_state.prediction_history = deque(maxlen=50)
     
     if st.session_state.prediction_history:
-        history_df = pd.DataFrame(st.session_state.prediction_history)
-        st.dataframe(history_df[['timestamp', 'risk_percentage']].tail(5))
+        # Last five entries, oldest first, without copying the whole deque
+        recent = list(islice(reversed(st.session_state.prediction_history), 5))
+        recent.reverse()
+        st.table(recent)
     else:
         st.write("No predictions made yet.")
 
 # Main header
 heart_icon_path = r"C:\Users\eshra\Downloads\11424092.png"  # Update this path to your image
-heart_icon_base64 = get_base64_image(heart_icon_path)
-
-if heart_icon_base64:
-    st.markdown(f"""
-    <div class="header-container">
-        <img src="data:image/png;base64,{heart_icon_base64}" width="60" style="vertical-align:middle; margin-right: 15px;">
-        <h1 class="title" style="display: inline;">Heart Disease Risk Assessment</h1>
-        <p class="subtitle">AI-Powered 10-Year Cardiovascular Risk Prediction</p>
-    </div>
-    """, unsafe_allow_html=True)
-else:
-    st.markdown("""
-    <div class="header-container">
-        <h1 class="title">❤️ Heart Disease Risk Assessment</h1>
-        <p class="subtitle">AI-Powered 10-Year Cardiovascular Risk Prediction</p>
-    </div>
-    """, unsafe_allow_html=True)
+render_header(heart_icon_path)
 
 # Health motivation section with glassmorphism
-st.markdown("""
-<div style="
-    background: rgba(255, 255, 255, 0.1);
-    backdrop-filter: blur(15px);
-    border: 1px solid rgba(255, 255, 255, 0.2);
-    border-radius: 20px;
-    padding: 2rem;
-    margin: 2rem 0;
-    text-align: center;
-    box-shadow: 0 8px 32px 0 rgba(31, 38, 135, 0.37);
-    animation: slideIn 0.8s ease-out;
-">
-    <h3 style="color: #2d3436; margin-bottom: 1.5rem; font-weight: 600; font-size: 1.8rem;">
-        💪 Your Heart, Your Health, Your Future
-    </h3>
-    <p style="font-size: 1.1rem; color: #636e72; line-height: 1.6; margin-bottom: 2rem; font-weight: 400;">
-        Every heartbeat is a reminder of life's precious gift. Taking charge of your cardiovascular health today 
-        means more quality moments with loved ones tomorrow.
-    </p>
-    <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 1.5rem; margin-top: 2rem;">
-        <div style="
-            background: rgba(255, 255, 255, 0.05);
-            border-radius: 15px;
-            padding: 1.5rem;
-            text-align: center;
-            backdrop-filter: blur(10px);
-            border: 1px solid rgba(255, 255, 255, 0.1);
-            transition: transform 0.3s ease, box-shadow 0.3s ease;
-        " onmouseover="this.style.transform='translateY(-5px)'; this.style.boxShadow='0 12px 40px rgba(0,0,0,0.15)'" 
-           onmouseout="this.style.transform='translateY(0)'; this.style.boxShadow='none'">
-            <span style="font-size: 3rem; display: block; margin-bottom: 1rem;">🏃‍♂️</span>
-            <p style="margin: 0.5rem 0; font-weight: 600; color: #2d3436; font-size: 1.1rem;">Stay Active</p>
-            <small style="color: #636e72; line-height: 1.4;">30 minutes of daily exercise keeps your heart strong</small>
-        </div>
-        <div style="
-            background: rgba(255, 255, 255, 0.05);
-            border-radius: 15px;
-            padding: 1.5rem;
-            text-align: center;
-            backdrop-filter: blur(10px);
-            border: 1px solid rgba(255, 255, 255, 0.1);
-            transition: transform 0.3s ease, box-shadow 0.3s ease;
-        " onmouseover="this.style.transform='translateY(-5px)'; this.style.boxShadow='0 12px 40px rgba(0,0,0,0.15)'" 
-           onmouseout="this.style.transform='translateY(0)'; this.style.boxShadow='none'">
-            <span style="font-size: 3rem; display: block; margin-bottom: 1rem;">🥗</span>
-            <p style="margin: 0.5rem 0; font-weight: 600; color: #2d3436; font-size: 1.1rem;">Eat Smart</p>
-            <small style="color: #636e72; line-height: 1.4;">Heart-healthy nutrition fuels your body</small>
-        </div>
-        <div style="
-            background: rgba(255, 255, 255, 0.05);
-            border-radius: 15px;
-            padding: 1.5rem;
-            text-align: center;
-            backdrop-filter: blur(10px);
-            border: 1px solid rgba(255, 255, 255, 0.1);
-            transition: transform 0.3s ease, box-shadow 0.3s ease;
-        " onmouseover="this.style.transform='translateY(-5px)'; this.style.boxShadow='0 12px 40px rgba(0,0,0,0.15)'" 
-           onmouseout="this.style.transform='translateY(0)'; this.style.boxShadow='none'">
-            <span style="font-size: 3rem; display: block; margin-bottom: 1rem;">😌</span>
-            <p style="margin: 0.5rem 0; font-weight: 600; color: #2d3436; font-size: 1.1rem;">manage Stress</p>
-            <small style="color: #636e72; line-height: 1.4;">Mental wellness protects your heart</small>
-        </div>
-        <div style="
-            background: rgba(255, 255, 255, 0.05);
-            border-radius: 15px;
-            padding: 1.5rem;
-            text-align: center;
-            backdrop-filter: blur(10px);
-            border: 1px solid rgba(255, 255, 255, 0.1);
-            transition: transform 0.3s ease, box-shadow 0.3s ease;
-        " onmouseover="this.style.transform='translateY(-5px)'; this.style.boxShadow='0 12px 40px rgba(0,0,0,0.15)'" 
-           onmouseout="this.style.transform='translateY(0)'; this.style.boxShadow='none'">
-            <span style="font-size: 3rem; display: block; margin-bottom: 1rem;">🩺</span>
-            <p style="margin: 0.5rem 0; font-weight: 600; color: #2d3436; font-size: 1.1rem;">Regular Checkups</p>
-            <small style="color: #636e72; line-height: 1.4;">Prevention is the best medicine</small>
-        </div>
-    </div>
-</div>
-""", unsafe_allow_html=True)
+render_motivation()
 
 with st.form(key="enhanced_prediction_form"):
     st.markdown("### 📝 Patient Information")
@@ -421,23 +280,32 @@ if submit_button:
     diabetes_val = 1 if diabetes == "Yes" else 0
     prevalentHyp_val = 1 if prevalentHyp == "Yes" else 0
     
-    # Create input array
-    X = np.array([[age, male_val, currentSmoker_val, cigsPerDay, totChol,
-                   sysBP, diaBP, BMI, heartRate, glucose,
-                   diabetes_val, prevalentHyp_val]])
-    
-    # Make prediction
-    with st.spinner("Analyzing patient data..."):
-        X_scaled = scaler.transform(X)
-        prediction = model.predict(X_scaled)[0]
-        prob = model.predict_proba(X_scaled)[0][1] * 100
+    # Fill the per-session input buffer (feature order matches training)
+    if 'x_buf' not in st.session_state:
+        st.session_state.x_buf = np.empty(12, dtype=np.float32)
+    x = st.session_state.x_buf
+    x[0] = age
+    x[1] = male_val
+    x[2] = currentSmoker_val
+    x[3] = cigsPerDay
+    x[4] = totChol
+    x[5] = sysBP
+    x[6] = diaBP
+    x[7] = BMI
+    x[8] = heartRate
+    x[9] = glucose
+    x[10] = diabetes_val
+    x[11] = prevalentHyp_val
+    
+    # Make prediction (fused scaler + logistic regression)
+    z = float(W @ x) + B
+    prob = 100.0 / (1.0 + math.exp(-z))
+    risk_idx = int(np.searchsorted(_BINS, prob, side='right'))
     
     # Store in history
     st.session_state.prediction_history.append({
         'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M"),
-        'age': age,
-        'risk_percentage': f"{prob:.1f}%",
-        'risk_level': 'High' if prob > 50 else 'Moderate' if prob > 20 else 'Low'
+        'risk_percentage': f"{prob:.1f}%"
     })
     
     # Results display
@@ -445,6 +313,7 @@ if submit_button:
     
     # Risk gauge visualization
     if PLOTLY_AVAILABLE:
+        import plotly.graph_objects as go
         fig = go.Figure(go.Indicator(
             mode = "gauge+number+delta",
             value = prob,
@@ -475,7 +344,7 @@ if submit_button:
             height=400
         )
         
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, key="risk_gauge")
     else:
         # Fallback progress bar visualization
         st.markdown(f"""
@@ -489,7 +358,7 @@ if submit_button:
                 position:relative;">
                 <div style="
                     width:{prob}%;
-                    background: {'linear-gradient(to right, #ff6b6b, #fab1a0)' if prob > 50 else 'linear-gradient(to right, #ffeaa7, #fdcb6e)' if prob > 20 else 'linear-gradient(to right, #00b894, #55a3ff)'};
+                    background: {_RISK_GRADIENTS[risk_idx]};
                     height:30px;
                     border-radius:10px;
                     display:flex;
@@ -504,33 +373,7 @@ if submit_button:
         """, unsafe_allow_html=True)
     
     # Risk interpretation
-    if prob < 20:
-        risk_level = "Low Risk"
-        risk_color = "#96ceb4"
-        risk_icon = "✅"
-        recommendations = [
-            "Continue maintaining healthy lifestyle habits",
-            "Regular exercise and balanced diet",
-            "Annual health check-ups"
-        ]
-    elif prob < 50:
-        risk_level = "Moderate Risk"
-        risk_color = "#ffeaa7"
-        risk_icon = "⚠️"
-        recommendations = [
-            "Consider lifestyle modifications",
-            "Monitor blood pressure and cholesterol regularly",
-            "Discuss prevention strategies with your doctor"
-        ]
-    else:
-        risk_level = "High Risk"
-        risk_color = "#fab1a0"
-        risk_icon = "🚨"
-        recommendations = [
-            "Immediate medical consultation recommended",
-            "Consider medication if advised by physician",
-            "Urgent lifestyle changes needed"
-        ]
+    risk_level, risk_color, risk_icon, recommendations = _RISKS[risk_idx]
     
     # Display results with enhanced styling
     col1, col2, col3 = st.columns(3)
@@ -545,7 +388,7 @@ if submit_button:
         """, unsafe_allow_html=True)
     
     with col2:
-        relative_risk = "High" if prob > np.mean([20, 50]) else "Average"
+        relative_risk = "High" if prob > _RELATIVE_RISK_CUTOFF else "Average"
         st.markdown(f"""
         <div class="metric-card">
             <h3>📊 Relative Risk</h3>
@@ -572,22 +415,8 @@ if submit_button:
     # Risk factors analysis
     st.markdown("### 📈 Risk Factor Analysis")
     
-    risk_factors_data = {
-        'Factor': ['Age', 'Gender', 'Smoking', 'Cholesterol', 'Blood Pressure', 'BMI', 'Diabetes'],
-        'Your Value': [age, male, currentSmoker, totChol, f"{sysBP}/{diaBP}", f"{BMI:.1f}", diabetes],
-        'Risk Level': [
-            'High' if age > 65 else 'Moderate' if age > 45 else 'Low',
-            'Higher' if male == 'Male' else 'Lower',
-            'High' if currentSmoker == 'Yes' else 'Low',
-            'High' if totChol > 240 else 'Moderate' if totChol > 200 else 'Low',
-            'High' if sysBP > 140 or diaBP > 90 else 'Moderate' if sysBP > 120 else 'Low',
-            'High' if BMI > 30 else 'Moderate' if BMI > 25 else 'Low',
-            'High' if diabetes == 'Yes' else 'Low'
-        ]
-    }
-    
-    df_factors = pd.DataFrame(risk_factors_data)
-    st.dataframe(df_factors, use_container_width=True)
+    st.table([dict(zip(_RISK_COLUMNS, row))
+              for row in _risk_row(age, male, currentSmoker, totChol, sysBP, diaBP, BMI, diabetes)])
 
 # Footer
 st.markdown("---")
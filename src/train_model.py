@@ -1,15 +1,33 @@
 import os
+import numpy as np
+import numexpr as ne
+from numba import njit, prange
 import pandas as pd
 import joblib
 from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import StandardScaler
 from sklearn.linear_model import LogisticRegression
-from sklearn.metrics import accuracy_score, confusion_matrix, classification_report, roc_auc_score
+from sklearn.metrics import classification_report, roc_auc_score
 
 # Paths
 DATA_PATH = r"C:\Users\eshra\heart-disease-prediction\data\framingham.csv"  # adjust if needed
 MODEL_DIR = "../model"
 
+ne.set_num_threads(os.cpu_count())
+
+@njit(parallel=True, fastmath=True, cache=True)
+def score(y_true, y_prob, thresh):
+    """Confusion counts (tp, fp, fn, tn) for y_prob >= thresh in one pass."""
+    tp = fp = fn = tn = 0
+    for i in prange(y_true.shape[0]):
+        p = 1 if y_prob[i] >= thresh else 0
+        t = 1 if y_true[i] == 1 else 0
+        tp += p * t
+        fp += p * (1 - t)
+        fn += (1 - p) * t
+        tn += (1 - p) * (1 - t)
+    return tp, fp, fn, tn
+
 def main():
     # Load dataset
     df = pd.read_csv(DATA_PATH)
@@ -23,12 +41,23 @@ def main():
 
     df = df[FEATURES + [TARGET]].dropna()
 
-    X = df[FEATURES].values
+    X = df[FEATURES].values.astype(np.float64)
     y = df[TARGET].values
 
-    # Scale features
+    # Scale features in a single fused pass (same result as StandardScaler.fit_transform)
+    mu = X.mean(axis=0)
+    var = X.var(axis=0)
+    sd = np.sqrt(var)
+    sd[sd == 0.0] = 1.0  # StandardScaler leaves constant columns unscaled
+    X_scaled = ne.evaluate("(X - mu) / sd")
+
+    # Keep a fitted StandardScaler so the saved artifact stays compatible with app.py
     scaler = StandardScaler()
-    X_scaled = scaler.fit_transform(X)
+    scaler.mean_ = mu
+    scaler.var_ = var
+    scaler.scale_ = sd
+    scaler.n_features_in_ = X.shape[1]
+    scaler.n_samples_seen_ = X.shape[0]
 
     # Train-test split
     X_train, X_test, y_train, y_test = train_test_split(
@@ -40,18 +69,27 @@ def main():
     model.fit(X_train, y_train)
 
     # Evaluate
-    y_pred = model.predict(X_test)
     y_prob = model.predict_proba(X_test)[:,1]
+    y_pred = (y_prob >= 0.5).astype(y_test.dtype)
+    tp, fp, fn, tn = score(y_test, y_prob, 0.5)
 
-    print("Accuracy:", accuracy_score(y_test, y_pred))
+    print("Accuracy:", (tp + tn) / len(y_test))
     print("ROC-AUC:", roc_auc_score(y_test, y_prob))
     print("Classification report:\n", classification_report(y_test, y_pred))
-    print("Confusion matrix:\n", confusion_matrix(y_test, y_pred))
+    print("Confusion matrix:\n", np.array([[tn, fp], [fn, tp]]))
 
     # Save model & scaler
     os.makedirs(MODEL_DIR, exist_ok=True)
     joblib.dump(model, os.path.join(MODEL_DIR, "logistic_model.pkl"))
     joblib.dump(scaler, os.path.join(MODEL_DIR, "scaler.pkl"))
+    # Plain weight arrays for app.py, which avoids importing sklearn at startup
+    np.savez(
+        os.path.join(MODEL_DIR, "weights.npz"),
+        coef=model.coef_[0].astype(np.float32),
+        intercept=model.intercept_.astype(np.float32),
+        mean=scaler.mean_.astype(np.float32),
+        scale=scaler.scale_.astype(np.float32),
+    )
     print("✅ Model and scaler saved in", MODEL_DIR)
 
 if __name__ == "__main__":